@@ -5,6 +5,10 @@ A modern chat application supporting web, CLI, and REST API interfaces with
 real-time messaging via WebSocket, user authentication, and admin functionality.
 """
 
+import importlib as _importlib
+import importlib.util as _importlib_util
+from typing import Any as _Any
+
 __version__ = "0.1.0"
 __author__ = "DankerChat Team"
 __email__ = "team@dankerchat.dev"
@@ -12,12 +16,23 @@ __description__ = (
     "Multi-interface chat application with Flask backend and real-time messaging"
 )
 
-# Import main components for easy access
-try:
-    from .client import DankerChatClient
-    from .server import create_app
-except ImportError:
-    # Modules not yet implemented - this is expected during initial setup
-    pass
+# Main components are resolved lazily so `import dankerchat` does not pull in
+# Flask, SQLAlchemy or SocketIO until one of them is actually used
+_LAZY_ATTRIBUTES = {
+    "create_app": ".server",
+    "DankerChatClient": ".client",
+}
+
+
+def __getattr__(name: str) -> _Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    # Submodules may not be implemented yet - report them as missing attributes
+    if module_name is None or _importlib_util.find_spec(module_name, __name__) is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(_importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = ["create_app", "DankerChatClient", "__version__"]
@@ -0,0 +1,86 @@
+"""Shared fixtures for the UV migration tests."""
+
+import json
+import shutil
+import subprocess
+import tomllib
+from pathlib import Path
+
+import pytest
+from filelock import FileLock
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+PYPROJECT_PATH = PROJECT_ROOT / "pyproject.toml"
+
+
+def _run_uv_sync(project_root):
+    try:
+        return subprocess.run(
+            ["uv", "sync"],
+            cwd=project_root,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except FileNotFoundError:
+        pytest.fail("UV command not found in PATH")
+
+
+@pytest.fixture(scope="session")
+def project_root():
+    """Project root directory the UV commands run in."""
+    return PROJECT_ROOT
+
+
+@pytest.fixture(scope="session")
+def pyproject_config():
+    """Parse pyproject.toml once and share the result across the session."""
+    return tomllib.loads(PYPROJECT_PATH.read_bytes().decode("utf-8"))
+
+
+@pytest.fixture(scope="session")
+def uv_info():
+    """Resolve the uv executable and its `--version` output once per session."""
+    uv_path = shutil.which("uv")
+    if uv_path is None:
+        pytest.fail("UV command not found in PATH")
+    try:
+        result = subprocess.run(
+            [uv_path, "--version"], capture_output=True, text=True, check=True
+        )
+    except subprocess.CalledProcessError:
+        pytest.fail(f"UV command at {uv_path} is not working")
+    return {"path": Path(uv_path), "version": result.stdout}
+
+
+@pytest.fixture(scope="session")
+def uv_sync_result(project_root, tmp_path_factory, request):
+    """Run `uv sync` once and share the completed process across the session.
+
+    Under pytest-xdist the first worker to get here runs the sync and leaves
+    the result on disk for the other workers to pick up. Without xdist
+    (or with `-p no:xdist`) there are no workers and the sync just runs.
+    """
+    if not hasattr(request.config, "workerinput"):
+        return _run_uv_sync(project_root)
+
+    result_path = tmp_path_factory.getbasetemp().parent / "uv_sync_result.json"
+    with FileLock(f"{result_path}.lock"):
+        if result_path.is_file():
+            return subprocess.CompletedProcess(**json.loads(result_path.read_text()))
+        result = _run_uv_sync(project_root)
+        result_path.write_text(json.dumps(vars(result)))
+    return result
+
+
+@pytest.fixture
+def clean_project(project_root, tmp_path):
+    """Copy of the project without uv.lock or .venv, for timing a fresh sync.
+
+    Syncing a copy leaves the shared .venv alone for tests running on other
+    xdist workers.
+    """
+    for name in ("pyproject.toml", "README.md"):
+        shutil.copy2(project_root / name, tmp_path / name)
+    shutil.copytree(project_root / "src", tmp_path / "src")
+    return tmp_path
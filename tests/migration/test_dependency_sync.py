@@ -4,104 +4,80 @@ This test verifies that UV can properly sync dependencies.
 These tests MUST FAIL initially (RED phase) before migration.
 """
 
-import shutil
+import os
 import subprocess
+import sys
 from pathlib import Path
+from typing import ClassVar
 
 import pytest
 
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
 
 class TestDependencySync:
     """Test UV dependency synchronization."""
 
-    @property
-    def project_root(self):
-        return Path(__file__).parent.parent.parent
+    project_root: ClassVar[Path] = PROJECT_ROOT
 
-    def test_uv_sync_creates_lockfile(self):
+    @pytest.mark.slow
+    def test_uv_sync_creates_lockfile(self, uv_sync_result):
         """Test that UV sync creates uv.lock file."""
         lockfile_path = self.project_root / "uv.lock"
 
         # This will fail initially since we don't have pyproject.toml
-        try:
-            subprocess.run(
-                ["uv", "sync"],
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            assert lockfile_path.exists(), "uv.lock not created after sync"
-        except subprocess.CalledProcessError:
-            pytest.fail("UV sync failed - likely missing pyproject.toml")
+        assert uv_sync_result.returncode == 0, (
+            "UV sync failed - likely missing pyproject.toml"
+        )
+        assert lockfile_path.exists(), "uv.lock not created after sync"
 
-    def test_uv_sync_creates_venv(self):
+    @pytest.mark.slow
+    def test_uv_sync_creates_venv(self, uv_sync_result):
         """Test that UV sync creates .venv directory."""
         venv_path = self.project_root / ".venv"
 
-        try:
-            subprocess.run(
-                ["uv", "sync"],
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            assert venv_path.exists(), ".venv directory not created after sync"
-            assert venv_path.is_dir(), ".venv is not a directory"
-        except subprocess.CalledProcessError:
-            pytest.fail("UV sync failed to create virtual environment")
+        assert uv_sync_result.returncode == 0, (
+            "UV sync failed to create virtual environment"
+        )
+        assert venv_path.exists(), ".venv directory not created after sync"
+        assert venv_path.is_dir(), ".venv is not a directory"
 
-    def test_uv_run_python_works(self):
-        """Test that uv run python executes correctly."""
-        try:
-            result = subprocess.run(
-                ["uv", "run", "python", "--version"],
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            assert "Python" in result.stdout
-        except subprocess.CalledProcessError:
-            pytest.fail("uv run python failed")
+    @pytest.mark.slow
+    def test_uv_run_python_works(self, uv_sync_result):
+        """Test that the UV-managed Python is a supported version."""
+        assert uv_sync_result.returncode == 0, "UV sync failed"
+        # pytest itself runs under `uv run`, so check the interpreter in-process
+        assert sys.version_info >= (3, 11), f"Python 3.11+ required, got {sys.version}"
 
     def test_uv_environment_isolation(self):
         """Test that UV creates isolated environment."""
-        try:
-            # Check that UV environment has different site-packages than system
-            result = subprocess.run(
-                ["uv", "run", "python", "-c", "import sys; print(sys.path)"],
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            # Should contain .venv path
-            assert ".venv" in result.stdout
-        except subprocess.CalledProcessError:
-            pytest.fail("UV environment isolation check failed")
+        # Should be running from the project's .venv rather than system Python
+        assert ".venv" in sys.prefix or ".venv" in sys.executable, (
+            f"Not running inside the UV environment: {sys.prefix}"
+        )
 
-    def test_uv_sync_performance(self):
+    @pytest.mark.slow
+    def test_uv_sync_performance(self, clean_project):
         """Test that UV sync completes within reasonable time (<15 seconds)."""
         import time
 
-        # Clean state for timing test
-        lockfile_path = self.project_root / "uv.lock"
-        venv_path = self.project_root / ".venv"
-
-        if lockfile_path.exists():
-            lockfile_path.unlink()
-        if venv_path.exists():
-            shutil.rmtree(venv_path)
+        # Keep pytest-cov's subprocess hook out of the interpreters uv starts:
+        # they would resolve --cov's relative source paths against the copy
+        # and add it to the coverage report
+        env = {
+            key: value
+            for key, value in os.environ.items()
+            if not key.startswith("COV_CORE_") and key != "COVERAGE_PROCESS_START"
+        }
 
         start_time = time.time()
         try:
             subprocess.run(
                 ["uv", "sync"],
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
+                cwd=clean_project,
+                env=env,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 check=True,
                 timeout=30,  # Fail if takes longer than 30 seconds
             )
@@ -6,20 +6,19 @@ These tests MUST FAIL initially (RED phase) before migration.
 
 import tomllib
 from pathlib import Path
+from typing import ClassVar
 
 import pytest
 
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
 
 class TestPyprojectConfig:
     """Test pyproject.toml configuration."""
 
-    @property
-    def project_root(self):
-        return Path(__file__).parent.parent.parent
+    project_root: ClassVar[Path] = PROJECT_ROOT
 
-    @property
-    def pyproject_path(self):
-        return self.project_root / "pyproject.toml"
+    pyproject_path: ClassVar[Path] = PROJECT_ROOT / "pyproject.toml"
 
     def test_pyproject_toml_exists(self):
         """Test that pyproject.toml file exists."""
@@ -28,51 +27,38 @@ class TestPyprojectConfig:
     def test_pyproject_toml_valid_format(self):
         """Test that pyproject.toml is valid TOML format."""
         try:
-            with open(self.pyproject_path, "rb") as f:
-                tomllib.load(f)
-        except Exception as e:
+            tomllib.loads(self.pyproject_path.read_bytes().decode("utf-8"))
+        except tomllib.TOMLDecodeError as e:
             pytest.fail(f"pyproject.toml is not valid TOML: {e}")
 
-    def test_project_metadata_present(self):
+    def test_project_metadata_present(self, pyproject_config):
         """Test that required project metadata is present."""
-        with open(self.pyproject_path, "rb") as f:
-            config = tomllib.load(f)
-
-        assert "project" in config, "Missing [project] section"
-        project = config["project"]
+        assert "project" in pyproject_config, "Missing [project] section"
+        project = pyproject_config["project"]
 
         required_fields = ["name", "version", "description"]
         for field in required_fields:
             assert field in project, f"Missing required field: project.{field}"
 
-    def test_dependencies_section_present(self):
+    def test_dependencies_section_present(self, pyproject_config):
         """Test that dependencies section exists."""
-        with open(self.pyproject_path, "rb") as f:
-            config = tomllib.load(f)
-
-        assert "project" in config, "Missing [project] section"
-        project = config["project"]
+        assert "project" in pyproject_config, "Missing [project] section"
+        project = pyproject_config["project"]
         assert "dependencies" in project, "Missing project.dependencies"
         assert isinstance(project["dependencies"], list), "dependencies must be a list"
 
-    def test_build_system_present(self):
+    def test_build_system_present(self, pyproject_config):
         """Test that build-system is configured."""
-        with open(self.pyproject_path, "rb") as f:
-            config = tomllib.load(f)
-
-        assert "build-system" in config, "Missing [build-system] section"
-        build_system = config["build-system"]
+        assert "build-system" in pyproject_config, "Missing [build-system] section"
+        build_system = pyproject_config["build-system"]
         assert "requires" in build_system, "Missing build-system.requires"
         assert "build-backend" in build_system, "Missing build-system.build-backend"
 
-    def test_tool_uv_section_present(self):
+    def test_tool_uv_section_present(self, pyproject_config):
         """Test that UV-specific configuration exists."""
-        with open(self.pyproject_path, "rb") as f:
-            config = tomllib.load(f)
-
         # UV configuration is optional, but if present should be valid
-        if "tool" in config and "uv" in config["tool"]:
-            uv_config = config["tool"]["uv"]
+        if "tool" in pyproject_config and "uv" in pyproject_config["tool"]:
+            uv_config = pyproject_config["tool"]["uv"]
             assert isinstance(uv_config, dict), "tool.uv must be a dictionary"
 
 
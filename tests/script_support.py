@@ -0,0 +1,75 @@
+"""
+Shared helpers for the script-style verification tests (T005, T008, T009)
+
+These modules double as standalone scripts run by CI, so this file is imported
+as a sibling module rather than through a conftest.
+"""
+
+import contextlib
+import shutil
+import signal
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Resolve uv once; without it every check fails, so skip spawning anything
+UV_PATH = shutil.which("uv")
+UV_AVAILABLE = UV_PATH is not None
+UV_BIN = UV_PATH or "uv"
+
+
+# While a driver runs, report lines are buffered here and written out in one
+# go; worker threads collect into their own list so results stay in order.
+# Outside a driver (under pytest, say) there is no buffer and lines are printed
+_log = None
+_task_log = threading.local()
+
+
+def log(msg=""):
+    """Report a line, buffering it while a driver is collecting output"""
+    lines = getattr(_task_log, "lines", _log)
+    if lines is None:
+        print(msg)
+    else:
+        lines.append(msg)
+
+
+def _exit_on_sigterm(signum, frame):
+    """Turn SIGTERM into SystemExit so the buffered report still gets written"""
+    sys.exit(128 + signum)
+
+
+@contextlib.contextmanager
+def buffered_report():
+    """Buffer report lines for a driver run and write them with one write() call
+
+    The lines are written on the way out even if the run raises or is killed
+    with SIGINT/SIGTERM (a cancelled CI job), so a failure part way through
+    still shows the report so far.
+    """
+    global _log
+    _log = []
+    previous_handler = signal.signal(signal.SIGTERM, _exit_on_sigterm)
+    try:
+        yield
+    finally:
+        signal.signal(signal.SIGTERM, previous_handler)
+        lines, _log = _log, None
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _run_buffered(test_func):
+    """Run a test on a worker thread, returning (passed, its log lines)"""
+    _task_log.lines = []
+    try:
+        return test_func(), _task_log.lines
+    finally:
+        del _task_log.lines
+
+
+def run_concurrently(tests):
+    """Run independent tests in a thread pool, yielding results in list order"""
+    with ThreadPoolExecutor(max_workers=min(8, len(tests))) as executor:
+        futures = [executor.submit(_run_buffered, func) for _, func in tests]
+        for (test_name, _), future in zip(tests, futures, strict=True):
+            yield test_name, *future.result()
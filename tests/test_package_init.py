@@ -0,0 +1,45 @@
+"""
+Package Import Test
+
+Purpose: Verify `import dankerchat` stays lightweight and resolves its main
+components lazily
+"""
+
+import importlib.util
+import subprocess
+import sys
+
+import pytest
+
+import dankerchat
+
+
+def test_import_does_not_load_flask():
+    """Test that importing the package leaves Flask unimported"""
+    # A fresh interpreter, since other tests in this session import Flask
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, dankerchat; sys.exit('flask' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, f"flask imported by dankerchat: {result.stderr}"
+
+
+def test_helper_imports_are_private():
+    """Test that the lazy-loading imports do not leak as package attributes"""
+    for name in ("importlib", "Any"):
+        assert not hasattr(dankerchat, name), f"dankerchat.{name} is public"
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("dankerchat.server") is not None,
+    reason="dankerchat.server is implemented",
+)
+def test_missing_component_raises_attribute_error():
+    """Test that create_app is reported missing while .server does not exist"""
+    with pytest.raises(AttributeError, match="create_app"):
+        dankerchat.create_app  # noqa: B018
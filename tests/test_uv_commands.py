@@ -8,11 +8,23 @@ Expected State: FAIL - UV project commands should not work yet (no pyproject.tom
 Target: After UV migration complete, this test should PASS
 """
 
+import functools
+import os
+import re
 import subprocess
 import sys
 from pathlib import Path
 
+from script_support import (
+    UV_AVAILABLE,
+    UV_BIN,
+    buffered_report,
+    log,
+    run_concurrently,
+)
 
+
+@functools.lru_cache(maxsize=1)
 def get_project_root():
     """Get the project root directory"""
     current = Path(__file__).parent
@@ -23,71 +35,144 @@ def get_project_root():
     return Path.cwd()
 
 
-def run_uv_command(cmd_args, expect_success=True):
-    """Helper to run UV commands and capture output"""
-    project_root = get_project_root()
+_PROJECT_ROOT_STR = str(get_project_root())
+
+# uv only sees the variables it needs: its own settings, where to find
+# binaries, caches and certificates, how to reach the package index, and what
+# the interpreters it starts with `uv run` need to load and decode text
+_UV_ENV_NAMES = frozenset(
+    {
+        "PATH",
+        "HOME",
+        "USER",
+        "USERPROFILE",
+        "APPDATA",
+        "LOCALAPPDATA",
+        "SYSTEMROOT",
+        "TMPDIR",
+        "TEMP",
+        "TMP",
+        "LANG",
+        "LC_ALL",
+        "LC_CTYPE",
+        "LD_LIBRARY_PATH",
+        "DYLD_LIBRARY_PATH",
+        "VIRTUAL_ENV",
+        "SSL_CERT_FILE",
+        "SSL_CERT_DIR",
+        "SSL_CLIENT_CERT",
+        "HTTP_PROXY",
+        "HTTPS_PROXY",
+        "ALL_PROXY",
+        "NO_PROXY",
+        "NETRC",
+    }
+)
+_UV_ENV = {
+    key: value
+    for key, value in os.environ.items()
+    if key.upper() in _UV_ENV_NAMES or key.startswith(("UV_", "XDG_"))
+}
+
+
+# Commands that may resolve or download packages get longer than metadata queries
+_NETWORK_COMMANDS = frozenset({"sync", "add", "remove", "lock", "run"})
+_FAST_TIMEOUT = 5
+_NETWORK_TIMEOUT = 20
+
+
+def _timeout_for(cmd_args):
+    """Timeout in seconds for a UV command, based on its subcommand"""
+    if cmd_args[0] in _NETWORK_COMMANDS and "--help" not in cmd_args:
+        return _NETWORK_TIMEOUT
+    return _FAST_TIMEOUT
+
+
+def run_uv_command(cmd_args, expect_success=True, capture_stdout=True):
+    """Helper to run UV commands and capture output
+
+    With capture_stdout=False only stderr is kept, for commands whose tests
+    look at nothing but the return code and the error message.
+    """
+    if not UV_AVAILABLE:
+        log("❌ UV command not found")
+        return None
     try:
+        # subprocess.run kills and reaps the child itself when the timeout expires
         result = subprocess.run(
-            ["uv"] + cmd_args,
-            capture_output=True,
-            text=True,
-            cwd=str(project_root),
-            timeout=30,
+            [UV_BIN] + cmd_args,
+            stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            cwd=_PROJECT_ROOT_STR,
+            env=_UV_ENV,
+            timeout=_timeout_for(cmd_args),
         )
         return result
     except subprocess.TimeoutExpired:
-        print(f"❌ Command timeout: uv {' '.join(cmd_args)}")
+        log(f"❌ Command timeout: uv {' '.join(cmd_args)}")
         return None
     except FileNotFoundError:
-        print("❌ UV command not found")
+        log("❌ UV command not found")
         return None
 
 
+# Failure output that the remove and pip check tests still accept
+_NOT_FOUND_RE = re.compile(b"not found", re.IGNORECASE)
+_PIP_CHECK_OK_RE = re.compile(
+    b"conflict|userpath|pipx|system|incompatible", re.IGNORECASE
+)
+
+
+def _stderr_text(result):
+    """Decode a command's stderr for a failure message"""
+    return result.stderr.decode(errors="replace").strip()
+
+
 def test_uv_sync():
     """Test that 'uv sync' works to install dependencies"""
-    result = run_uv_command(["sync"])
+    result = run_uv_command(["sync"], capture_stdout=False)
 
     if result is None:
         return False
 
     if result.returncode == 0:
-        print("✅ 'uv sync' completed successfully")
+        log("✅ 'uv sync' completed successfully")
         return True
     else:
-        print(f"❌ 'uv sync' failed: {result.stderr.strip()}")
+        log(f"❌ 'uv sync' failed: {_stderr_text(result)}")
         return False
 
 
 def test_uv_add():
     """Test that 'uv add' works to add new dependencies"""
     # Try to add a simple test dependency
-    result = run_uv_command(["add", "--dev", "black"])
+    result = run_uv_command(["add", "--dev", "black"], capture_stdout=False)
 
     if result is None:
         return False
 
     if result.returncode == 0:
-        print("✅ 'uv add' works for development dependencies")
+        log("✅ 'uv add' works for development dependencies")
         return True
     else:
-        print(f"❌ 'uv add' failed: {result.stderr.strip()}")
+        log(f"❌ 'uv add' failed: {_stderr_text(result)}")
         return False
 
 
 def test_uv_remove():
     """Test that 'uv remove' works to remove dependencies"""
     # This may fail if black wasn't added, which is expected
-    result = run_uv_command(["remove", "--dev", "black"])
+    result = run_uv_command(["remove", "--dev", "black"], capture_stdout=False)
 
     if result is None:
         return False
 
     # Either success or "not found" is acceptable for this test
-    if result.returncode == 0 or "not found" in result.stderr.lower():
-        print("✅ 'uv remove' command functional")
+    if result.returncode == 0 or _NOT_FOUND_RE.search(result.stderr):
+        log("✅ 'uv remove' command functional")
         return True
     else:
-        print(f"❌ 'uv remove' failed unexpectedly: {result.stderr.strip()}")
+        log(f"❌ 'uv remove' failed unexpectedly: {_stderr_text(result)}")
         return False
 
 
@@ -98,11 +183,11 @@ def test_uv_run():
     if result is None:
         return False
 
-    if result.returncode == 0 and "Hello from UV" in result.stdout:
-        print("✅ 'uv run' executes Python commands")
+    if result.returncode == 0 and b"Hello from UV" in result.stdout:
+        log("✅ 'uv run' executes Python commands")
         return True
     else:
-        print(f"❌ 'uv run' failed: {result.stderr.strip()}")
+        log(f"❌ 'uv run' failed: {_stderr_text(result)}")
         return False
 
 
@@ -115,34 +200,27 @@ def test_uv_shell():
     if result is None:
         return False
 
-    if result.returncode == 0 and "run" in result.stdout.lower():
-        print("✅ 'uv run' command available (equivalent to shell activation)")
+    if result.returncode == 0 and b"run" in result.stdout.lower():
+        log("✅ 'uv run' command available (equivalent to shell activation)")
         return True
     else:
-        print("❌ 'uv run' command not available")
+        log("❌ 'uv run' command not available")
         return False
 
 
 def test_uv_lock():
     """Test that 'uv lock' works to update dependency lockfile"""
-    result = run_uv_command(["lock"])
+    result = run_uv_command(["lock"], capture_stdout=False)
 
     if result is None:
         return False
 
+    # uv only exits 0 once it has written uv.lock, so no separate check is needed
     if result.returncode == 0:
-        print("✅ 'uv lock' completed successfully")
-
-        # Check if uv.lock was created
-        project_root = get_project_root()
-        if (project_root / "uv.lock").exists():
-            print("✅ uv.lock file created")
-            return True
-        else:
-            print("❌ uv.lock file not created")
-            return False
+        log("✅ 'uv lock' completed successfully")
+        return True
     else:
-        print(f"❌ 'uv lock' failed: {result.stderr.strip()}")
+        log(f"❌ 'uv lock' failed: {_stderr_text(result)}")
         return False
 
 
@@ -154,10 +232,10 @@ def test_uv_tree():
         return False
 
     if result.returncode == 0:
-        print("✅ 'uv tree' shows dependency information")
+        log("✅ 'uv tree' shows dependency information")
         return True
     else:
-        print(f"❌ 'uv tree' failed: {result.stderr.strip()}")
+        log(f"❌ 'uv tree' failed: {_stderr_text(result)}")
         return False
 
 
@@ -169,15 +247,16 @@ def test_uv_pip_list():
         return False
 
     if result.returncode == 0:
-        lines = result.stdout.strip().split("\n")
-        if len(lines) >= 2:  # Header + at least one package
-            print(f"✅ 'uv pip list' shows {len(lines) - 1} packages")
+        # Every line, the last included, ends in a newline
+        n_lines = result.stdout.count(b"\n")
+        if n_lines >= 2:  # Header + at least one package
+            log(f"✅ 'uv pip list' shows {n_lines - 1} packages")
             return True
         else:
-            print("❌ 'uv pip list' shows no packages")
+            log("❌ 'uv pip list' shows no packages")
             return False
     else:
-        print(f"❌ 'uv pip list' failed: {result.stderr.strip()}")
+        log(f"❌ 'uv pip list' failed: {_stderr_text(result)}")
         return False
 
 
@@ -189,59 +268,70 @@ def test_uv_pip_check():
         return False
 
     if result.returncode == 0:
-        print("✅ 'uv pip check' found no dependency conflicts")
+        log("✅ 'uv pip check' found no dependency conflicts")
         return True
     else:
         # Some conflicts might be expected during migration or in CI
-        stderr_lower = result.stderr.lower()
-        if any(
-            keyword in stderr_lower
-            for keyword in ["conflict", "userpath", "pipx", "system", "incompatible"]
-        ):
-            print(
-                "⚠️  'uv pip check' found conflicts (expected in CI/system environment)"
-            )
+        if _PIP_CHECK_OK_RE.search(result.stderr):
+            log("⚠️  'uv pip check' found conflicts (expected in CI/system environment)")
             return True
         else:
-            print(f"❌ 'uv pip check' failed: {result.stderr.strip()}")
+            log(f"❌ 'uv pip check' failed: {_stderr_text(result)}")
             return False
 
 
 def run_all_tests():
     """Run all UV command integration tests"""
-    print("=== UV Commands Integration Verification Tests (T009) ===")
-    print("EXPECTED STATE: FAIL (no pyproject.toml for UV project commands)")
-    print("")
-
-    tests = [
-        ("uv sync", test_uv_sync),
-        ("uv add", test_uv_add),
-        ("uv remove", test_uv_remove),
-        ("uv run", test_uv_run),
-        ("uv run (shell equivalent)", test_uv_shell),
-        ("uv lock", test_uv_lock),
-        ("uv tree", test_uv_tree),
-        ("uv pip list", test_uv_pip_list),
-        ("uv pip check", test_uv_pip_check),
-    ]
-
-    passed = 0
-    total = len(tests)
-
-    for test_name, test_func in tests:
-        print(f"Running: {test_name}")
-        if test_func():
-            passed += 1
-        print("")
-
-    print(f"Results: {passed}/{total} tests passed")
-
-    if passed == total:
-        print("🎉 ALL TESTS PASSED - UV commands fully integrated")
-        return True
-    else:
-        print(f"❌ {total - passed} tests failed - UV project integration incomplete")
-        return False
+    with buffered_report():
+        log("=== UV Commands Integration Verification Tests (T009) ===")
+        log("EXPECTED STATE: FAIL (no pyproject.toml for UV project commands)")
+        log("")
+
+        if not UV_AVAILABLE:
+            log("❌ UV not installed - skipping UV command tests")
+            return False
+
+        # Commands that change the project or environment run first, in order
+        mutating_tests = [
+            ("uv sync", test_uv_sync),
+            ("uv add", test_uv_add),
+            ("uv remove", test_uv_remove),
+            ("uv run", test_uv_run),
+            ("uv lock", test_uv_lock),
+        ]
+        # The rest only read the project and can run at once
+        read_only_tests = [
+            ("uv run (shell equivalent)", test_uv_shell),
+            ("uv tree", test_uv_tree),
+            ("uv pip list", test_uv_pip_list),
+            ("uv pip check", test_uv_pip_check),
+        ]
+
+        passed = 0
+        total = len(mutating_tests) + len(read_only_tests)
+
+        for test_name, test_func in mutating_tests:
+            log(f"Running: {test_name}")
+            if test_func():
+                passed += 1
+            log("")
+
+        for test_name, test_passed, lines in run_concurrently(read_only_tests):
+            log(f"Running: {test_name}")
+            for line in lines:
+                log(line)
+            if test_passed:
+                passed += 1
+            log("")
+
+        log(f"Results: {passed}/{total} tests passed")
+
+        success = passed == total
+        if success:
+            log("🎉 ALL TESTS PASSED - UV commands fully integrated")
+        else:
+            log(f"❌ {total - passed} tests failed - UV project integration incomplete")
+        return success
 
 
 if __name__ == "__main__":